@@ -0,0 +1,94 @@
+"""
+Check that the copies of the game rules agree: the Python functions of tic-tac-toe.py, its batch simulation,
+the numba core (game_core_jit.py) and the Cython core (game_core.pyx, once built with `cythonize -i game_core.pyx`).
+Cores that cannot be imported are skipped.
+
+Run with: python check_game_cores.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+
+NUM_GAMES = 5000
+
+
+def load_game() -> ModuleType:
+    """Import tic-tac-toe.py, whose file name is not a valid module name
+
+    Returns:
+        ModuleType: the game module
+    """
+    spec = importlib.util.spec_from_file_location("tic_tac_toe", Path(__file__).with_name("tic-tac-toe.py"))
+    assert spec is not None and spec.loader is not None
+    game = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = game
+    spec.loader.exec_module(game)
+    return game
+
+
+def load_cores() -> dict[str, ModuleType]:
+    """Import the compiled cores that are available
+
+    Returns:
+        dict[str, ModuleType]: compiled cores by module name
+    """
+    cores = {}
+    for name in ("game_core_jit", "game_core"):
+        try:
+            cores[name] = importlib.import_module(name)
+        except ImportError:
+            print(f"skipping {name}: not available")
+    return cores
+
+
+def check_move_rules(game: ModuleType, cores: dict[str, ModuleType]) -> None:
+    """Compare winner detection and winning move search on every pair of bitboards a game can reach
+
+    Args:
+        game (ModuleType): the game module
+        cores (dict[str, ModuleType]): compiled cores by module name
+    """
+    boards = [(player_bits, opponent_bits) for player_bits in range(512) for opponent_bits in range(512)
+              if not player_bits & opponent_bits and not game.check_winner_bits(player_bits)]
+    expected = [game.find_winning_move(player_bits, opponent_bits) for player_bits, opponent_bits in boards]
+
+    player_array = np.array([player_bits for player_bits, _ in boards], dtype=np.uint16)
+    opponent_array = np.array([opponent_bits for _, opponent_bits in boards], dtype=np.uint16)
+    assert game.find_winning_moves(player_array, opponent_array).tolist() == expected, "batch simulation"
+
+    for name, core in cores.items():
+        for bits in range(512):
+            assert bool(core.check_winner_bits(bits)) == game.check_winner_bits(bits), name
+        found = [core.find_winning_move(player_bits, opponent_bits) for player_bits, opponent_bits in boards]
+        assert found == expected, name
+
+
+def check_games(cores: dict[str, ModuleType]) -> None:
+    """Play the same games on every compiled core and compare the winners and the random values consumed
+
+    Args:
+        cores (dict[str, ModuleType]): compiled cores by module name
+    """
+    if len(cores) < 2:
+        print("skipping game comparison: needs both compiled cores")
+        return
+    rng_buf = np.random.default_rng(0).integers(0, 2520, size=NUM_GAMES * 200, dtype=np.int16)
+    results = {}
+    for name, core in cores.items():
+        cursor = np.zeros(1, dtype=np.int64)
+        results[name] = [(core.play_meta_game_bots_core(rng_buf, cursor), int(cursor[0])) for _ in range(NUM_GAMES)]
+    reference, *others = results.values()
+    for name, result in zip(list(results)[1:], others):
+        assert result == reference, name
+
+
+if __name__ == '__main__':
+    game = load_game()
+    cores = load_cores()
+    check_move_rules(game, cores)
+    check_games(cores)
+    print(f"game rules agree across: tic-tac-toe.py, batch simulation, {', '.join(cores) or 'no compiled core'}")
@@ -0,0 +1,154 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython compiled core of the bot vs bot meta game.
+
+Same logic as game_core_jit.py, built ahead of time so there is no JIT warm-up. Build it in place with:
+
+    cythonize -i game_core.pyx
+
+Takes the same random stream and cursor as game_core_jit.py, and gives the same winner for them
+(see check_game_cores.py).
+"""
+
+from libc.stdint cimport int16_t, int32_t, int64_t
+
+cdef int32_t FULL_BOARD = 0b111111111
+# Same winning line masks as LINES in tic-tac-toe.py
+cdef int32_t LINES[8]
+LINES[:] = [0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124]
+# See MOVE_DRAWS in game_core_jit.py
+cdef enum:
+    MOVE_DRAWS = 2
+
+
+cdef inline int count_bits(int32_t bits) noexcept nogil:
+    """Count the cells set in a bitboard"""
+    cdef int count = 0
+    while bits:
+        bits &= bits - 1
+        count += 1
+    return count
+
+
+cpdef bint check_winner_bits(int32_t bits) noexcept nogil:
+    """Check if a bitboard of a single player covers any of the winning lines
+
+    Args:
+        bits (int): cells claimed by the player
+
+    Returns:
+        bool: True if a line is complete otherwise False
+    """
+    return ((bits & 0o007) == 0o007) | ((bits & 0o070) == 0o070) | ((bits & 0o700) == 0o700) | \
+        ((bits & 0o111) == 0o111) | ((bits & 0o222) == 0o222) | ((bits & 0o444) == 0o444) | \
+        ((bits & 0o421) == 0o421) | ((bits & 0o124) == 0o124)
+
+
+cpdef int find_winning_move(int32_t player_bits, int32_t opponent_bits) noexcept nogil:
+    """Find an empty cell that completes a line for the player
+
+    Args:
+        player_bits (int): cells claimed by the player
+        opponent_bits (int): cells claimed by the opponent
+
+    Returns:
+        int: bit index of the winning cell or -1 if there is none
+    """
+    cdef int32_t empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+    cdef int32_t missing_cell
+    cdef int i
+    for i in range(8):
+        if count_bits(player_bits & LINES[i]) == 2:
+            missing_cell = LINES[i] & ~player_bits & empty_bits
+            if missing_cell:
+                return count_bits(missing_cell - 1)
+    return -1
+
+
+cdef inline int draw_random(const int16_t[::1] rng_buf, int64_t *position, int count) noexcept nogil:
+    """Read the next value of the random stream, reduced to [0, count)"""
+    cdef int16_t value = rng_buf[position[0]]
+    position[0] += 1
+    return value % count
+
+
+cdef inline int pick_random_bit(int32_t cells_mask, const int16_t[::1] rng_buf, int64_t *position) noexcept nogil:
+    """Pick one of the cells set in a non-empty bitmask at random"""
+    cdef int skip = draw_random(rng_buf, position, count_bits(cells_mask))
+    cdef int i
+    for i in range(skip):
+        cells_mask &= cells_mask - 1
+    return count_bits((cells_mask & -cells_mask) - 1)
+
+
+cpdef int play_meta_game_bots_core(const int16_t[::1] rng_buf, int64_t[::1] cursor) noexcept nogil:
+    """Play a game between 2 bots
+
+    Args:
+        rng_buf (np.ndarray): pre-generated random stream of the random moves
+        cursor (np.ndarray): single element array with the position of the next value, advanced in place
+
+    Returns:
+        int: value of the winning player (1 or -1), or 0 if the random stream ran out before the end of the game
+    """
+    cdef int32_t x_bits[9]
+    cdef int32_t o_bits[9]
+    cdef int32_t results_x_bits = 0
+    cdef int32_t results_o_bits = 0
+    cdef int32_t open_boards, empty_bits, player_bits, opponent_bits
+    cdef int board_pos, cell, player
+    cdef bint won
+    cdef int64_t position = cursor[0]
+
+    for board_pos in range(9):
+        x_bits[board_pos] = 0
+        o_bits[board_pos] = 0
+
+    if position >= rng_buf.shape[0]:
+        return 0
+    player = 1 if draw_random(rng_buf, &position, 2) else -1
+    while not (check_winner_bits(results_x_bits) or check_winner_bits(results_o_bits)):
+        if rng_buf.shape[0] - position < MOVE_DRAWS:
+            cursor[0] = position
+            return 0
+        open_boards = ~(results_x_bits | results_o_bits) & FULL_BOARD
+        if open_boards:
+            board_pos = pick_random_bit(open_boards, rng_buf, &position)
+        else:
+            # drawn meta board, see choose_board in tic-tac-toe.py
+            board_pos = draw_random(rng_buf, &position, 9)
+            x_bits[board_pos] = 0
+            o_bits[board_pos] = 0
+            results_x_bits &= ~(1 << board_pos)
+            results_o_bits &= ~(1 << board_pos)
+
+        if player == 1:
+            player_bits, opponent_bits = x_bits[board_pos], o_bits[board_pos]
+        else:
+            player_bits, opponent_bits = o_bits[board_pos], x_bits[board_pos]
+
+        cell = find_winning_move(player_bits, opponent_bits)
+        won = cell >= 0
+        if not won:
+            cell = find_winning_move(opponent_bits, player_bits)
+        if cell < 0:
+            empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+            if empty_bits:
+                cell = pick_random_bit(empty_bits, rng_buf, &position)
+
+        if cell < 0:
+            # tied instance board, see play_meta_game_bots in tic-tac-toe.py
+            x_bits[board_pos] = 0
+            o_bits[board_pos] = 0
+        elif player == 1:
+            x_bits[board_pos] |= 1 << cell
+            if won:
+                results_x_bits |= 1 << board_pos
+        else:
+            o_bits[board_pos] |= 1 << cell
+            if won:
+                results_o_bits |= 1 << board_pos
+        player = -player
+
+    cursor[0] = position
+    return 1 if check_winner_bits(results_x_bits) else -1
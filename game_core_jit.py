@@ -0,0 +1,166 @@
+"""
+Numba compiled core of the bot vs bot meta game.
+
+Mirrors the bitboard logic of tic-tac-toe.py (offensive move, then defensive move, then a random move) with
+plain integers so the whole game loop runs without the interpreter. Players are the values 1 (X) and -1 (O).
+Random choices are read from a pre-generated stream of integers, each uniform over a multiple of 1 - 9.
+"""
+
+import numpy as np
+from numba import njit
+
+FULL_BOARD = 0b111111111
+# Same winning line masks as LINES in tic-tac-toe.py
+LINES = np.array([0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124], dtype=np.int32)
+# Most values a single move reads from the random stream: one to pick the board + one to pick the cell
+MOVE_DRAWS = 2
+
+
+@njit(cache=True)
+def count_bits(bits: int) -> int:
+    """Count the cells set in a bitboard
+
+    Args:
+        bits (int): bitboard
+
+    Returns:
+        int: number of cells set
+    """
+    count = 0
+    while bits:
+        bits &= bits - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def check_winner_bits(bits: int) -> bool:
+    """Check if a bitboard of a single player covers any of the winning lines
+
+    Args:
+        bits (int): cells claimed by the player
+
+    Returns:
+        bool: True if a line is complete otherwise False
+    """
+    return ((bits & 0o007) == 0o007) | ((bits & 0o070) == 0o070) | ((bits & 0o700) == 0o700) | \
+        ((bits & 0o111) == 0o111) | ((bits & 0o222) == 0o222) | ((bits & 0o444) == 0o444) | \
+        ((bits & 0o421) == 0o421) | ((bits & 0o124) == 0o124)
+
+
+@njit(cache=True)
+def find_winning_move(player_bits: int, opponent_bits: int) -> int:
+    """Find an empty cell that completes a line for the player
+
+    Args:
+        player_bits (int): cells claimed by the player
+        opponent_bits (int): cells claimed by the opponent
+
+    Returns:
+        int: bit index of the winning cell or -1 if there is none
+    """
+    empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+    for line in LINES:
+        if count_bits(player_bits & line) == 2:
+            missing_cell = line & ~player_bits & empty_bits
+            if missing_cell:
+                return count_bits(missing_cell - 1)
+    return -1
+
+
+@njit(cache=True)
+def draw_random(rng_buf: np.ndarray, cursor: np.ndarray, count: int) -> int:
+    """Read the next value of the random stream, reduced to [0, count)
+
+    Args:
+        rng_buf (np.ndarray): pre-generated random stream
+        cursor (np.ndarray): single element array with the position of the next value, advanced in place
+        count (int): number of possible outcomes (1 - 9)
+
+    Returns:
+        int: random value in [0, count)
+    """
+    value = rng_buf[cursor[0]]
+    cursor[0] += 1
+    return int(value % count)
+
+
+@njit(cache=True)
+def pick_random_bit(cells_mask: int, rng_buf: np.ndarray, cursor: np.ndarray) -> int:
+    """Pick one of the cells set in a non-empty bitmask at random
+
+    Args:
+        cells_mask (int): bitmask of cells
+        rng_buf (np.ndarray): pre-generated random stream
+        cursor (np.ndarray): position of the next value in the random stream
+
+    Returns:
+        int: bit index of the cell picked
+    """
+    for _ in range(draw_random(rng_buf, cursor, count_bits(cells_mask))):
+        cells_mask &= cells_mask - 1
+    return count_bits((cells_mask & -cells_mask) - 1)
+
+
+@njit(cache=True)
+def play_meta_game_bots_core(rng_buf: np.ndarray, cursor: np.ndarray) -> int:
+    """Play a game between 2 bots
+
+    Args:
+        rng_buf (np.ndarray): pre-generated random stream of the random moves
+        cursor (np.ndarray): single element array with the position of the next value, advanced in place
+
+    Returns:
+        int: value of the winning player (1 or -1), or 0 if the random stream ran out before the end of the game
+    """
+    x_bits = np.zeros(9, dtype=np.int32)
+    o_bits = np.zeros(9, dtype=np.int32)
+    results_x_bits = 0
+    results_o_bits = 0
+
+    if cursor[0] >= len(rng_buf):
+        return 0
+    player = 1 if draw_random(rng_buf, cursor, 2) else -1
+    while not (check_winner_bits(results_x_bits) or check_winner_bits(results_o_bits)):
+        if len(rng_buf) - cursor[0] < MOVE_DRAWS:
+            return 0
+        open_boards = ~(results_x_bits | results_o_bits) & FULL_BOARD
+        if open_boards:
+            board_pos = pick_random_bit(open_boards, rng_buf, cursor)
+        else:
+            # drawn meta board, see choose_board in tic-tac-toe.py
+            board_pos = draw_random(rng_buf, cursor, 9)
+            x_bits[board_pos] = 0
+            o_bits[board_pos] = 0
+            results_x_bits &= ~(1 << board_pos)
+            results_o_bits &= ~(1 << board_pos)
+
+        if player == 1:
+            player_bits, opponent_bits = x_bits[board_pos], o_bits[board_pos]
+        else:
+            player_bits, opponent_bits = o_bits[board_pos], x_bits[board_pos]
+
+        cell = find_winning_move(player_bits, opponent_bits)
+        won = cell >= 0
+        if not won:
+            cell = find_winning_move(opponent_bits, player_bits)
+        if cell < 0:
+            empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+            if empty_bits:
+                cell = pick_random_bit(empty_bits, rng_buf, cursor)
+
+        if cell < 0:
+            # tied instance board, see play_meta_game_bots in tic-tac-toe.py
+            x_bits[board_pos] = 0
+            o_bits[board_pos] = 0
+        elif player == 1:
+            x_bits[board_pos] |= 1 << cell
+            if won:
+                results_x_bits |= 1 << board_pos
+        else:
+            o_bits[board_pos] |= 1 << cell
+            if won:
+                results_o_bits |= 1 << board_pos
+        player = -player
+
+    return 1 if check_winner_bits(results_x_bits) else -1
@@ -28,12 +28,35 @@ import numpy as np
 import random
 import logging
 from collections import Counter
+from array import array
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Callable
 
 logging.getLogger().setLevel(logging.ERROR)
 
+# A board is a pair of 9-bit bitboards (X cells, O cells); cell (row, column) is bit row * 3 + column
+Board = tuple[int, int]
+FULL_BOARD = 0b111111111
+# Winning lines as 9-bit masks (octal digits are rows): 3 rows, 3 columns and 2 diagonals
+LINES = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+# WIN_TABLE[bits] tells whether the 9-bit mask covers any of the winning lines
+WIN_TABLE = np.array([any((bits & line) == line for line in LINES)
+                     for bits in range(512)], dtype=bool)
+# POPCOUNT_TABLE[bits] is the number of cells set in the 9-bit mask
+POPCOUNT_TABLE = np.array([bits.bit_count() for bits in range(512)])
+# CELLS_TABLE[bits] lists the bit indices of the cells set in the 9-bit mask, padded with zeros to 9 entries
+CELLS_TABLE = np.array([[cell for cell in range(9) if (bits >> cell) & 1] + [0] * (9 - bits.bit_count())
+                        for bits in range(512)])
+# Random stream of the compiled bot vs bot game, filled by fill_random_stream and consumed through RNG_CURSOR.
+# 2520 is divisible by every count of choices (1 - 9), so each value % count stays uniform.
+# The stream is regenerated before a game once fewer than RNG_STREAM_HEADROOM values are left (~10 games' worth)
+RNG_STREAM_RANGE = 2520
+RNG_STREAM_HEADROOM = 1024
+RNG_STREAM = np.zeros(1 << 16, dtype=np.int16)
+RNG_CURSOR = np.array([len(RNG_STREAM)], dtype=np.int64)  # empty until the first bot game
+
 
 class Status(Enum):
     OFFENSE = 0
@@ -48,343 +71,567 @@ class Player:
     property_value: int
 
 
-def create_board() -> np.ndarray:
-    """Create a 3 x 3 board initialised to zero value
+@dataclass
+class MetaBoard:
+    # bitboards of the 9 instance boards stored side by side, indexed by the position of the instance board (0 - 8)
+    x_bits: "array[int]" = field(default_factory=lambda: array("i", [0] * 9))
+    o_bits: "array[int]" = field(default_factory=lambda: array("i", [0] * 9))
+    # outcome of the individual instance boards, itself a tic tac toe board: instance boards won by X and by O
+    results_x_bits: int = 0
+    results_o_bits: int = 0
+    # instance boards won by either player, kept up to date alongside the two bitboards above
+    results_occupied: int = 0
+
+
+def create_board() -> Board:
+    """Create an empty 3 x 3 board as a pair of 9-bit bitboards (X cells, O cells)
+
+    Returns:
+        Board: bitboards with no cells claimed
+    """
+    return (0, 0)
+
+
+def board_to_array(instance_board: Board) -> np.ndarray:
+    """Expand the bitboards into a 3 x 3 grid of [1, 0, -1] for display
+
+    Args:
+        instance_board (Board): instance of tic tac toe board
 
     Returns:
-        np.ndarray: zero filled 3 x 3 board
+        np.ndarray: 3 x 3 board filled with the player values
     """
-    return np.zeros((3, 3), dtype=int)
+    x_bits, o_bits = instance_board
+    cell_shifts = np.arange(9)
+    x_cells = (x_bits >> cell_shifts) & 1
+    o_cells = (o_bits >> cell_shifts) & 1
+    return (x_cells - o_cells).reshape((3, 3))
+
 
+def to_index(board_pos: tuple[int, int]) -> int:
+    """Convert the positional indices of a cell into its bit index
 
-def find_available_cells(instance_board: np.ndarray) -> np.ndarray:
+    Args:
+        board_pos (tuple[int, int]): row and column of the cell
+
+    Returns:
+        int: bit index of the cell (0 - 8)
+    """
+    return board_pos[0] * 3 + board_pos[1]
+
+
+def find_available_cells(instance_board: Board) -> int:
     """Identify cells that are still unfilled
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
+        instance_board (Board): instance of tic tac toe board
 
     Returns:
-        np.ndarray: indices of all unfilled cells (if any)
+        int: bitmask of all unfilled cells (zero if there are none)
     """
-    return np.argwhere(instance_board == 0)
+    x_bits, o_bits = instance_board
+    return ~(x_bits | o_bits) & FULL_BOARD
 
 
-def pick_cell_randomly(instance_board: np.ndarray) -> tuple | None:
-    """Pick a random cell from the board
+def pick_random_bit(cells_mask: int) -> int:
+    """Pick one of the cells set in a bitmask at random
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
+        cells_mask (int): bitmask of cells
 
     Returns:
-        tuple | None: if a cell is available, return indices of that cell or 
-        None if no cell is available
+        int: bit index of the cell picked or -1 if the bitmask is empty
     """
-    cells_available = find_available_cells(instance_board)
-    cells_available_max = len(cells_available)
-    if cells_available_max > 0:
-        logging.info("cells available - assigning value")
-        random_cell = random.randint(0, cells_available_max-1)
-        return tuple(cells_available[random_cell])
-    else:
-        logging.warning("cells unavailable")
-        return None
+    if not cells_mask:
+        return -1
+    # clear the lowest set bits until the picked one is the lowest, then isolate it
+    for _ in range(random.randrange(cells_mask.bit_count())):
+        cells_mask &= cells_mask - 1
+    return (cells_mask & -cells_mask).bit_length() - 1
 
 
-def assign_cell(instance_board: np.ndarray, cell_indices: tuple, player: Player) -> None:
-    """If an empty cell has been chosen, it is assigned to the player
+def check_winner_bits(bits: int) -> bool:
+    """Check if a bitboard of a single player covers any of the winning lines
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
-        cell_indices (tuple): indices of the chosen cell
-        Player: player making the move
+        bits (int): cells claimed by the player
+
+    Returns:
+        bool: True if a line is complete otherwise False
     """
-    instance_board[cell_indices] = player.property_value
+    return bool(WIN_TABLE[bits])
 
 
-def check_winner(instance_board: np.ndarray, player: Player) -> bool:
+def check_winner(instance_board: Board, player: int) -> bool:
     """Check if the board has a winner, given the player
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
-        Player: check if this player won the board
+        instance_board (Board): instance of tic tac toe board
+        player (int): value of the player to check (1 or -1)
 
     Returns:
         bool: True if the player is the winner otherwise False
     """
-    player_val = player.property_value
-    row_check = np.all(instance_board[0, :] == player_val) | np.all(
-        instance_board[1, :] == player_val) | np.all(instance_board[2, :] == player_val)
-    column_check = np.all(instance_board[:, 0] == player_val) | np.all(
-        instance_board[:, 1] == player_val) | np.all(instance_board[:, 2] == player_val)
-    diagonal_check = np.all(np.array([instance_board[i, j] for i, j in zip(range(3), range(2, -1, -1))]) == player_val) | \
-        np.all(np.array([instance_board[i, i]
-               for i in range(3)]) == player_val)
-    return bool(row_check or column_check or diagonal_check)
+    return check_winner_bits(instance_board[0] if player == 1 else instance_board[1])
 
 
-def random_move(instance_board: np.ndarray, player: Player) -> bool:
-    """Randomly assign a cell within a board to a player
+def random_move(instance_board: Board) -> int:
+    """Randomly pick a cell within a board
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
-        Player: player making the move
+        instance_board (Board): instance of tic tac toe board
 
     Returns:
-        bool: True if it was successful, False otherwise
+        int: bit index of the cell picked or -1 if no cell is available
     """
-    cells_picked = pick_cell_randomly(instance_board)
-    if cells_picked:
-        assign_cell(instance_board, cells_picked, player)
-        return True
-    return False
+    return pick_random_bit(find_available_cells(instance_board))
 
 
-def defensive_move(instance_board: np.ndarray, player: Player) -> bool:
-    """Prevent the opponent (if possible) when making the winning move by claiming the cell
+def split_board(instance_board: Board, player: int) -> tuple[int, int]:
+    """Split the board into the bitboards of the player and their opponent
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
-        Player: player making the move
+        instance_board (Board): instance of tic tac toe board
+        player (int): value of the player of interest (1 or -1)
 
     Returns:
-        bool: True if it was successful, False otherwise
+        tuple[int, int]: cells claimed by the player + cells claimed by the opponent
     """
-    board_copy = instance_board.copy()
-    opponent_player = P2 if player.property_value == 1 else P1
-    cells_picked = pick_cell_randomly(board_copy)
-    while cells_picked:
-        assign_cell(board_copy, cells_picked, opponent_player)
-        if check_winner(board_copy, opponent_player):
-            assign_cell(instance_board, cells_picked, player)
-            return True
-        else:
-            attempts_tracker = Player(name="Tracker", property_value=101)
-            assign_cell(board_copy, cells_picked, attempts_tracker)
-            cells_picked = pick_cell_randomly(board_copy)
-    return False
+    x_bits, o_bits = instance_board
+    if player == 1:
+        return x_bits, o_bits
+    return o_bits, x_bits
 
 
-def offensive_move(instance_board: np.ndarray, player: Player) -> bool:
-    """Making the winning move if an opportunity exists
+def find_winning_move(player_bits: int, opponent_bits: int) -> int:
+    """Find an empty cell that completes a line for the player
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
-        Player: player making the move
+        player_bits (int): cells claimed by the player
+        opponent_bits (int): cells claimed by the opponent
 
     Returns:
-        bool: True if it was successful, False otherwise
+        int: bit index of the winning cell or -1 if there is none
     """
-    board_copy = instance_board.copy()
-    cells_picked = pick_cell_randomly(board_copy)
-    while cells_picked:
-        assign_cell(board_copy, cells_picked, player)
-        if check_winner(board_copy, player):
-            assign_cell(instance_board, cells_picked, player)
-            return True
-        else:
-            attempts_tracker = Player(name="Tracker", property_value=101)
-            assign_cell(board_copy, cells_picked, attempts_tracker)
-            cells_picked = pick_cell_randomly(board_copy)
-    return False
+    empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+    for line in LINES:
+        if (player_bits & line).bit_count() == 2:
+            missing_cell = line & ~player_bits & empty_bits
+            if missing_cell:
+                return missing_cell.bit_length() - 1
+    return -1
+
+
+def defensive_move(instance_board: Board, player: int) -> int:
+    """Find the cell to claim (if any) to prevent the opponent from making the winning move
+
+    Args:
+        instance_board (Board): instance of tic tac toe board
+        player (int): value of the player making the move (1 or -1)
+
+    Returns:
+        int: bit index of the cell to block or -1 if there is none
+    """
+    player_bits, opponent_bits = split_board(instance_board, player)
+    return find_winning_move(opponent_bits, player_bits)
+
+
+def offensive_move(instance_board: Board, player: int) -> int:
+    """Find the winning move if an opportunity exists
+
+    Args:
+        instance_board (Board): instance of tic tac toe board
+        player (int): value of the player making the move (1 or -1)
+
+    Returns:
+        int: bit index of the winning cell or -1 if there is none
+    """
+    player_bits, opponent_bits = split_board(instance_board, player)
+    return find_winning_move(player_bits, opponent_bits)
+
+
+def get_board(meta_board: MetaBoard, board_pos: int) -> Board:
+    """Fetch an instance board from the meta board
+
+    Args:
+        meta_board (MetaBoard): Board containing all the instance boards
+        board_pos (int): position of the instance board (0 - 8)
+
+    Returns:
+        Board: instance of tic tac toe board
+    """
+    return meta_board.x_bits[board_pos], meta_board.o_bits[board_pos]
+
+
+def set_board(meta_board: MetaBoard, board_pos: int, instance_board: Board) -> None:
+    """Store an instance board in the meta board
+
+    Args:
+        meta_board (MetaBoard): Board containing all the instance boards
+        board_pos (int): position of the instance board (0 - 8)
+        instance_board (Board): instance of tic tac toe board
+    """
+    meta_board.x_bits[board_pos], meta_board.o_bits[board_pos] = instance_board
 
 
-def fill_cell(instance_board: np.ndarray, player: Player) -> Status:
+def fill_cell(meta_board: MetaBoard, board_pos: int, player: int) -> Status:
     """Fill the cell with a winning move, defensive move or a random move
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
-        Player: player making the move
+        meta_board (MetaBoard): Board containing all the instance boards
+        board_pos (int): position of the instance board to play in (0 - 8)
+        player (int): value of the player making the move (1 or -1)
 
     Returns:
         Status: Return the type of move completed
     """
-    if offensive_move(instance_board, player) is False:
+    instance_board = get_board(meta_board, board_pos)
+    cell = offensive_move(instance_board, player)
+    if cell < 0:
         logging.info("winning move not available")
-        if defensive_move(instance_board, player) is False:
+        cell = defensive_move(instance_board, player)
+        if cell < 0:
             logging.info(
                 "opponent did not have a cell that needed to be blocked")
-            if random_move(instance_board, player) is False:
+            cell = random_move(instance_board)
+            if cell < 0:
                 logging.info("No cells available")
                 return Status.FULL
             else:
                 logging.info("Picked a random cell on the board")
-                return Status.RANDOM
+                status = Status.RANDOM
         else:
             logging.info("Successfully blocked a winning move by the opponent")
-            return Status.DEFENSE
+            status = Status.DEFENSE
     else:
         logging.warning("Found a winning move")
-        return Status.OFFENSE
-
+        status = Status.OFFENSE
+    if player == 1:
+        meta_board.x_bits[board_pos] |= 1 << cell
+    else:
+        meta_board.o_bits[board_pos] |= 1 << cell
+    return status
 
-def choose_player(current_player: Optional[Player] = None) -> Player:
-    """Choose a random player (when starting the game) or their opponent (when taking turns)
 
-    Args:
-        current_player (Optional[int], optional): player who made the latest move. 
-        Defaults to None when the game starts
+def choose_player() -> int:
+    """Choose a random player when starting the game (turns then pass to the opponent: -player)
 
     Returns:
-        Player: return the player chosen
+        int: value of the player chosen (1 or -1)
     """
-    if current_player:
-        if current_player.property_value == 1:
-            return P2
-        else:
-            return P1
-    else:
-        players = [P1, P2]
-        return random.choice(players)
+    return 1 if random.getrandbits(1) else -1
 
 
-def choose_board(meta_board: np.ndarray, meta_board_results: np.ndarray) -> tuple[np.ndarray, tuple[int, int]]:
+def choose_board(meta_board: MetaBoard) -> int:
     """Selecting a random instance of the board from the meta board
 
     Args:
-        meta_board (np.ndarray): 9 instances of a ti tac toe board in one big board
-        meta_board_results (np.ndarray): outcome of individual instance boards: [1, 0, -1]
+        meta_board (MetaBoard): 9 instances of a tic tac toe board + the outcome of each of them
 
     Returns:
-        tuple[np.ndarray, tuple[int, int]]: instance of the smaller board + positional indices of that board
+        int: position of the instance board (0 - 8)
     """
-    x, y = random.choice([0, 1, 2]), random.choice([0, 1, 2])
-    if is_board_complete(meta_board_results):
-        meta_board, meta_board_results = reset_board(
-            meta_board, meta_board_results, (x, y))
-    current_choice = meta_board_results[x, y]
-    if current_choice == 0:
-        return meta_board[x, y], (x, y)
-    return choose_board(meta_board, meta_board_results)
+    if is_meta_board_complete(meta_board):
+        # every instance board has been won without a meta winner: start one over
+        board_pos = random.randrange(9)
+        reset_board(meta_board, board_pos)
+        return board_pos
+    return pick_random_bit(~meta_board.results_occupied & FULL_BOARD)
 
 
-def is_board_complete(instance_board: np.ndarray) -> bool:
-    """Check to see if an instance board has every cell filled
+def is_meta_board_complete(meta_board: MetaBoard) -> bool:
+    """Check to see if every instance board of the meta board has been won
 
     Args:
-        instance_board (np.ndarray): instance of tic tac toe board
+        meta_board (MetaBoard): Board containing all the instance boards + their results
 
     Returns:
         bool: True if it is, False otherwise
     """
-    return bool(np.all(instance_board != 0))
+    return meta_board.results_occupied == FULL_BOARD
 
 
-def update_meta_results(meta_board_results: np.ndarray, board_pos: tuple[int, int], player: Player) -> np.ndarray:
+def update_meta_results(meta_board: MetaBoard, board_pos: int, player: int) -> None:
     """If an instance of a board has been won, update the results of the meta board
 
     Args:
-        meta_board_results (np.ndarray): results of the meta board
-        board_pos (tuple[int, int]): indices of the instance board in the meta board
-        Player: player of interest
+        meta_board (MetaBoard): Board containing all the instance boards + their results
+        board_pos (int): position of the instance board (0 - 8)
+        player (int): value of the player of interest (1 or -1)
+    """
+    board_bit = 1 << board_pos
+    # a board won again by the other player (possible in the human game) changes hands
+    if player == 1:
+        meta_board.results_x_bits |= board_bit
+        meta_board.results_o_bits &= ~board_bit
+    else:
+        meta_board.results_o_bits |= board_bit
+        meta_board.results_x_bits &= ~board_bit
+    meta_board.results_occupied |= board_bit
 
-    Returns:
-        np.ndarray: updated results of the meta board
+
+def reset_board(meta_board: MetaBoard, board_pos: int) -> None:
+    """Replace an instance of an existing board with a new board and also clear its cell in the meta board results
+
+    Args:
+        meta_board (MetaBoard): Board containing all the instance boards + their results
+        board_pos (int): position of the instance board (0 - 8)
     """
-    meta_board_results[board_pos] = player.property_value
-    return meta_board_results
+    set_board(meta_board, board_pos, create_board())
+    keep_mask = ~(1 << board_pos)
+    meta_board.results_x_bits &= keep_mask
+    meta_board.results_o_bits &= keep_mask
+    meta_board.results_occupied &= keep_mask
 
 
-def reset_board(meta_board: np.ndarray, meta_board_results: np.ndarray, board_pos: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
-    """Replace an instance of an existing board with a new board and also update its value to zero in the meta board
+def print_meta_board(meta_board: MetaBoard) -> None:
+    """Print the meta board and its results as grids of [1, 0, -1]
 
     Args:
-        meta_board (np.ndarray): Board containing all the other instance boards
-        meta_board_results (np.ndarray): results of the meta board
-        board_pos (tuple[int, int]): positional indices of the instance board
+        meta_board (MetaBoard): Board containing all the instance boards + their results
+    """
+    print("--------Meta Board (current)--------")
+    print(np.array([board_to_array(get_board(meta_board, board_pos))
+          for board_pos in range(9)]).reshape((3, 3, 3, 3)))
+
+    print("--------Meta Board Results(current)--------")
+    print(board_to_array((meta_board.results_x_bits, meta_board.results_o_bits)))
+
+
+@cache
+def load_game_core() -> Callable[[np.ndarray, np.ndarray], int] | None:
+    """Import the compiled bot vs bot game on first use, so the human game does not pay for it
 
     Returns:
-        tuple[np.ndarray, np.ndarray]: updated meta board and the results of the meta board
+        Callable[[np.ndarray, np.ndarray], int] | None: the Cython build of game_core.pyx if present, otherwise
+        the numba version if numba is installed, None if neither is available
+    """
+    try:
+        from game_core import play_meta_game_bots_core
+    except ImportError:
+        try:
+            from game_core_jit import play_meta_game_bots_core
+        except ImportError:
+            return None
+    core: Callable[[np.ndarray, np.ndarray], int] = play_meta_game_bots_core
+    return core
+
+
+def fill_random_stream(seed: int | None = None) -> None:
+    """Regenerate the random stream of the compiled bot vs bot game and rewind its cursor
+
+    Args:
+        seed (int | None, optional): seed of the stream. Defaults to None to draw one from the random module,
+        so a `random.seed` before the first bot game also fixes the compiled games
     """
-    meta_board[board_pos] = create_board()
-    meta_board_results[board_pos] = 0
-    return meta_board, meta_board_results
+    rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+    RNG_STREAM[:] = rng.integers(0, RNG_STREAM_RANGE, size=len(RNG_STREAM), dtype=np.int16)
+    RNG_CURSOR[0] = 0
 
 
-def play_meta_game_bots() -> Player:
+def play_meta_game_bots(seed: int | None = None) -> int:
     """Play a game between 2 bots
 
+    Args:
+        seed (int | None, optional): seed of the random moves. Defaults to None to carry on with the current
+        random state
+
     Returns:
-        Player: Winning player
+        int: value of the winning player (1 or -1)
     """
-    meta_board = np.array([create_board()]*9).reshape((3, 3, 3, 3))
-    meta_board_results = np.zeros((3, 3), dtype=int)
+    play_meta_game_bots_core = load_game_core()
+    if play_meta_game_bots_core is not None:
+        if seed is not None:
+            fill_random_stream(seed)
+        while True:
+            if len(RNG_STREAM) - RNG_CURSOR[0] < RNG_STREAM_HEADROOM:
+                fill_random_stream()
+            winner = play_meta_game_bots_core(RNG_STREAM, RNG_CURSOR)
+            if winner:
+                return winner
+            # the stream ran out in the middle of an unusually long game: replay it on a fresh stream
+            RNG_CURSOR[0] = len(RNG_STREAM)
+
+    if seed is not None:
+        random.seed(seed)
+    meta_board = MetaBoard()
 
     current_player = choose_player()
-    current_board, current_board_pos = choose_board(
-        meta_board, meta_board_results)
-    status = fill_cell(current_board, current_player)
+    current_board_pos = choose_board(meta_board)
+    status = fill_cell(meta_board, current_board_pos, current_player)
 
-    while not (check_winner(meta_board_results, P1)) and not (check_winner(meta_board_results, P2)):
+    while not (check_winner_bits(meta_board.results_x_bits) or check_winner_bits(meta_board.results_o_bits)):
         if status == Status.FULL:
-            meta_board, meta_board_results = reset_board(
-                meta_board, meta_board_results, current_board_pos)
+            # tied instance board: replace it with a fresh one
+            reset_board(meta_board, current_board_pos)
         else:
             if status == Status.OFFENSE:
-                meta_board_results = update_meta_results(
-                    meta_board_results, current_board_pos, current_player)
+                update_meta_results(
+                    meta_board, current_board_pos, current_player)
 
-        current_player = choose_player(current_player)
-        current_board, current_board_pos = choose_board(
-            meta_board, meta_board_results)
-        status = fill_cell(current_board, current_player)
+        current_player = -current_player
+        current_board_pos = choose_board(meta_board)
+        status = fill_cell(meta_board, current_board_pos, current_player)
 
-    if check_winner(meta_board_results, P2):
-        return P2
+    if check_winner_bits(meta_board.results_o_bits):
+        return -1
     else:
-        return P1
+        return 1
 
 
-def play_meta_game() -> Player:
-    """Play a game between a human and bot
+def find_winning_moves(player_bits: np.ndarray, opponent_bits: np.ndarray) -> np.ndarray:
+    """Vectorised `find_winning_move` over a batch of boards
+
+    Args:
+        player_bits (np.ndarray): cells claimed by the player in each board
+        opponent_bits (np.ndarray): cells claimed by the opponent in each board
 
     Returns:
-        Player: Winning player
+        np.ndarray: bit index of the winning cell in each board or -1 if there is none
     """
-    meta_board = np.array([create_board()]*9).reshape((3, 3, 3, 3))
-    meta_board_results = np.zeros((3, 3), dtype=int)
+    empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+    cells = np.full(len(player_bits), -1)
+    # walk the lines backwards so the first winning line takes precedence, as in find_winning_move
+    for line in reversed(LINES):
+        missing_cell = line & ~player_bits & empty_bits
+        found = (POPCOUNT_TABLE[player_bits & line] == 2) & (missing_cell != 0)
+        cells = np.where(found, CELLS_TABLE[missing_cell, 0], cells)
+    return cells
+
 
-    human_player = P1
-    bot_player = P2
+def pick_random_cells(cells_masks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Pick one of the cells set in each non-empty bitmask at random
+
+    Args:
+        cells_masks (np.ndarray): bitmasks of cells
+        rng (np.random.Generator): source of the random picks
+
+    Returns:
+        np.ndarray: bit index of the cell picked in each bitmask
+    """
+    picks: np.ndarray = CELLS_TABLE[cells_masks, rng.integers(0, POPCOUNT_TABLE[cells_masks])]
+    return picks
 
-    while not (check_winner(meta_board_results, human_player)) and not (check_winner(meta_board_results, bot_player)):
-        print("--------Meta Board (current)--------")
-        print(meta_board)
 
-        print("--------Meta Board Results(current)--------")
-        print(meta_board_results)
+def play_meta_game_bots_batch(num_games: int, seed: int | None = None) -> np.ndarray:
+    """Play a batch of games between 2 bots side by side, one move of every unfinished game per step
+
+    Args:
+        num_games (int): number of games to play
+        seed (int | None, optional): seed of the random moves. Defaults to None for a fresh seed
+
+    Returns:
+        np.ndarray: value of the winning player of each game (1 or -1)
+    """
+    rng = np.random.default_rng(seed)
+    x_bits = np.zeros((num_games, 9), dtype=np.uint16)
+    o_bits = np.zeros_like(x_bits)
+    results_x_bits = np.zeros(num_games, dtype=np.uint16)
+    results_o_bits = np.zeros_like(results_x_bits)
+    players = rng.choice(np.array([1, -1]), size=num_games)
+    winners = np.zeros(num_games, dtype=int)
+    games = np.arange(num_games)
+
+    while len(games):
+        open_boards = ~(results_x_bits[games] | results_o_bits[games]) & FULL_BOARD
+        drawn = open_boards == 0
+        if drawn.any():
+            # drawn meta board, see choose_board
+            drawn_games = games[drawn]
+            drawn_pos = rng.integers(0, 9, size=len(drawn_games))
+            x_bits[drawn_games, drawn_pos] = 0
+            o_bits[drawn_games, drawn_pos] = 0
+            keep_mask = (FULL_BOARD & ~(1 << drawn_pos)).astype(np.uint16)
+            results_x_bits[drawn_games] &= keep_mask
+            results_o_bits[drawn_games] &= keep_mask
+            open_boards[drawn] = 1 << drawn_pos
+        board_pos = pick_random_cells(open_boards, rng)
+
+        is_x = players[games] == 1
+        board_x_bits = x_bits[games, board_pos]
+        board_o_bits = o_bits[games, board_pos]
+        player_bits = np.where(is_x, board_x_bits, board_o_bits)
+        opponent_bits = np.where(is_x, board_o_bits, board_x_bits)
+
+        cells = find_winning_moves(player_bits, opponent_bits)
+        won = cells >= 0
+        cells = np.where(won, cells, find_winning_moves(
+            opponent_bits, player_bits))
+        empty_bits = ~(player_bits | opponent_bits) & FULL_BOARD
+        random_pick = (cells < 0) & (empty_bits != 0)
+        cells[random_pick] = pick_random_cells(empty_bits[random_pick], rng)
+
+        # no cell left: tied instance board, see play_meta_game_bots
+        full = cells < 0
+        cell_bits = np.where(full, 0, 1 << np.maximum(cells, 0))
+        x_bits[games, board_pos] = np.where(
+            full, 0, board_x_bits | np.where(is_x, cell_bits, 0))
+        o_bits[games, board_pos] = np.where(
+            full, 0, board_o_bits | np.where(is_x, 0, cell_bits))
+        board_bits = np.where(won, 1 << board_pos, 0)
+        results_x_bits[games] |= np.where(is_x, board_bits, 0).astype(np.uint16)
+        results_o_bits[games] |= np.where(is_x, 0, board_bits).astype(np.uint16)
+        players[games] = -players[games]
+
+        x_won = WIN_TABLE[results_x_bits[games]]
+        o_won = WIN_TABLE[results_o_bits[games]]
+        winners[games[x_won]] = 1
+        winners[games[o_won]] = -1
+        games = games[~(x_won | o_won)]
+
+    return winners
+
+
+def play_meta_game() -> int:
+    """Play a game between a human and bot
+
+    Returns:
+        int: value of the winning player (1 or -1)
+    """
+    meta_board = MetaBoard()
+
+    human_player = P1.property_value
+    bot_player = P2.property_value
+
+    while not (check_winner_bits(meta_board.results_x_bits) or check_winner_bits(meta_board.results_o_bits)):
+        print_meta_board(meta_board)
 
         instance_board_coord = input("Select any instance board -> x,y: ")
-        board_pos = (int(instance_board_coord[0]), int(
-            instance_board_coord[2]))
-        instance_board = meta_board[board_pos]
+        board_pos = to_index((int(instance_board_coord[0]), int(
+            instance_board_coord[2])))
+        instance_board = get_board(meta_board, board_pos)
         print("--------Instance Board selected--------")
-        print(instance_board)
+        print(board_to_array(instance_board))
 
         cell_coord_raw = input("Select the cell -> x,y: ")
         cell_coord = (int(cell_coord_raw[0]), int(cell_coord_raw[2]))
-        instance_board[cell_coord] = human_player.property_value
+        # the human may claim any cell, overwriting the bot's mark as before
+        cell_bit = 1 << to_index(cell_coord)
+        if human_player == 1:
+            meta_board.x_bits[board_pos] |= cell_bit
+            meta_board.o_bits[board_pos] &= ~cell_bit
+        else:
+            meta_board.o_bits[board_pos] |= cell_bit
+            meta_board.x_bits[board_pos] &= ~cell_bit
+        instance_board = get_board(meta_board, board_pos)
         print("--------Instance Board updated--------")
-        print(instance_board)
+        print(board_to_array(instance_board))
 
         # Check if human made a winning move
         if check_winner(instance_board, human_player):
-            meta_board_results = update_meta_results(
-                meta_board_results, board_pos, human_player)
+            update_meta_results(meta_board, board_pos, human_player)
 
         # Bot's turn to play
-        current_board, current_board_pos = choose_board(
-            meta_board, meta_board_results)
-        status = fill_cell(current_board, bot_player)
+        current_board_pos = choose_board(meta_board)
+        status = fill_cell(meta_board, current_board_pos, bot_player)
 
         if status == Status.FULL:
-            meta_board, meta_board_results = reset_board(
-                meta_board, meta_board_results, current_board_pos)
+            reset_board(meta_board, current_board_pos)
         else:
             if status == Status.OFFENSE:
-                meta_board_results = update_meta_results(
-                    meta_board_results, current_board_pos, bot_player)
+                update_meta_results(meta_board, current_board_pos, bot_player)
 
-    if check_winner(meta_board_results, bot_player):
+    if check_winner((meta_board.results_x_bits, meta_board.results_o_bits), bot_player):
         return bot_player
     else:
         return human_player
@@ -397,11 +644,12 @@ if __name__ == '__main__':
     # Bot vs Bot
     if player_type:
         # print(Counter([play_meta_game_bots() for _ in range(10)]))
-        winner = play_meta_game_bots()
+        winner_value = play_meta_game_bots()
     else:
         # Human vs Bot
         P1.name = 'Human'
         P2.name = 'Bot'
-        winner = play_meta_game()
+        winner_value = play_meta_game()
 
-    print(f"Winner: {winner.name}")
+    winner_name = P1.name if winner_value == 1 else P2.name
+    print(f"Winner: {winner_name}")